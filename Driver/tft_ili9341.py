@@ -1,17 +1,58 @@
-from machine import Pin, SPI
+from machine import Pin, SPI, mem32
 import time
+import struct
 import framebuf
 
+try:
+    import rp2
+    _DMA = rp2.DMA  # MicroPython 1.23+
+except (ImportError, AttributeError):
+    _DMA = None
+
+# RP2040 SPI0/SPI1 register blocks and their TX DREQ numbers
+_SPI_BASE = (0x4003C000, 0x40040000)
+_SPI_TX_DREQ = (16, 18)
+_SSPDR = 0x008
+_SSPSR = 0x00C
+_SSPICR = 0x020
+_SSPSR_RNE = 0x04
+_SSPSR_BSY = 0x10
+
+# blits smaller than this are cheaper to send blocking
+_DMA_MIN_BYTES = 512
+
+# window command bytes, sent straight from flash
+_CASET = b'\x2A'
+_PASET = b'\x2B'
+_RAMWR = b'\x2C'
+_RAMRD = b'\x2E'
+
+# clock the driver falls back to if the self-test fails at a higher one
+_SAFE_BAUDRATE = 40_000_000
+
+# clock for the self-test readback; the ILI9341 serial read cycle is at
+# least 150 ns, so reads are only reliable below about 6.6 MHz
+_READ_BAUDRATE = 6_000_000
+
+# colours kept in the colour -> bytes cache before it is reset
+_COLOUR_CACHE_MAX = 64
+
 
 class ILI9341:
     def __init__(self,
                  spi_id=0,
-                 baudrate=40_000_000,
+                 baudrate=62_500_000,
                  sck=2, mosi=3, miso=4,
                  cs=5, dc=6, rst=7,
-                 width=240, height=320):
+                 width=240, height=320,
+                 use_dma=True,
+                 self_test=True):
         self.width = width
         self.height = height
+        self.baudrate = baudrate
+        # result of the last benchmark_spi(): None (not run), "ok",
+        # "mismatch" or "no readback"
+        self.spi_check = None
 
         self.spi = SPI(spi_id,
                        baudrate=baudrate,
@@ -22,28 +63,124 @@ class ILI9341:
                        miso=Pin(miso))
 
         self.cs = Pin(cs, Pin.OUT, value=1)
-        self.dc = Pin(dc, Pin.OUT, value=0)
+        # DC idles high (data); only command bytes pull it low
+        self.dc = Pin(dc, Pin.OUT, value=1)
         self.rst = Pin(rst, Pin.OUT, value=1)
 
         # small line buffer for readback (240 pixels * 2 bytes)
         self._linebuf = bytearray(self.width * 2)
 
+        # column/row address payload, rewritten in place by _window_cmd
+        self._win_buf = bytearray(4)
+
+        # single command byte, rewritten in place by _write_cmd/_cmd_data
+        self._cmd_buf = bytearray(1)
+
+        # 512-pixel solid colour buffer reused by fill_rect
+        self._fill_chunk = bytearray(1024)
+        self._fill_mv = memoryview(self._fill_chunk)
+        self._fill_colour = None
+
+        # colour -> 2-byte big-endian pixel, shared by fill_rect and pixel
+        self._colour_bytes = {}
+
+        # scratch for text(): one 8px row of glyphs across the screen
+        # (30 chars at 240px)
+        self._text_buf = bytearray(self.width * 16)
+
+        # Optional DMA channel feeding the SPI TX FIFO. While a transfer is
+        # running CS stays low and _dma_buf keeps the source buffer alive;
+        # the next command waits for it (see wait_dma).
+        self._dma = None
+        self._dma_active = False
+        self._dma_buf = None
+        if use_dma and _DMA is not None:
+            base = _SPI_BASE[spi_id]
+            self._spi_dr = base + _SSPDR
+            self._spi_sr = base + _SSPSR
+            self._spi_icr = base + _SSPICR
+            self._dma = _DMA()
+            self._dma_ctrl = self._dma.pack_ctrl(
+                size=0,  # bytes
+                inc_write=False,
+                treq_sel=_SPI_TX_DREQ[spi_id],
+            )
+
         self._init_display()
 
+        # clocks above the usual ILI9341 rate are only kept if they verify
+        if self_test and baudrate > _SAFE_BAUDRATE:
+            self.benchmark_spi()
+
     # --- Low level helpers ---
 
     def _write_cmd(self, cmd):
+        if self._dma_active:
+            self.wait_dma()
+        self._cmd_buf[0] = cmd
         self.dc.value(0)
         self.cs.value(0)
-        self.spi.write(bytes([cmd]))
+        self.spi.write(self._cmd_buf)
         self.cs.value(1)
+        self.dc.value(1)
 
-    def _write_data(self, data_bytes):
+    def _cmd_data(self, cmd, data_bytes):
+        # command byte plus its parameters under a single CS assertion
+        if self._dma_active:
+            self.wait_dma()
+        self._cmd_buf[0] = cmd
+        self.cs.value(0)
+        self.dc.value(0)
+        self.spi.write(self._cmd_buf)
         self.dc.value(1)
+        self.spi.write(data_bytes)
+        self.cs.value(1)
+
+    def _write_data(self, data_bytes):
         self.cs.value(0)
         self.spi.write(data_bytes)
         self.cs.value(1)
 
+    def _write_data_nocs(self, data_bytes):
+        # caller must already hold CS low; DC is high outside of commands
+        self.spi.write(data_bytes)
+
+    def _write_data_dma(self, buf):
+        # start a background transfer of buf; CS must already be low and
+        # stays low until wait_dma()
+        self._dma_buf = buf
+        self._dma_active = True
+        self._dma.config(read=buf, write=self._spi_dr, count=len(buf),
+                         ctrl=self._dma_ctrl, trigger=True)
+
+    def wait_dma(self):
+        # block until a background transfer has fully left the SPI, then
+        # release CS. No-op if nothing is in flight.
+        if not self._dma_active:
+            return
+        dma = self._dma
+        while dma.active():
+            pass
+        while mem32[self._spi_sr] & _SSPSR_BSY:
+            pass
+        # TX-only DMA leaves junk (and an overrun) in the RX FIFO; drain it
+        # so the next blocking SPI call starts clean
+        while mem32[self._spi_sr] & _SSPSR_RNE:
+            mem32[self._spi_dr]
+        mem32[self._spi_icr] = 1
+        self.cs.value(1)
+        self._dma_active = False
+        self._dma_buf = None
+
+    def _pixel_bytes(self, colour):
+        b = self._colour_bytes.get(colour)
+        if b is None:
+            if len(self._colour_bytes) >= _COLOUR_CACHE_MAX:
+                self._colour_bytes = {}
+            b = bytes([(colour >> 8) & 0xFF, colour & 0xFF])
+            self._colour_bytes[colour] = b
+        return b
+
     def _reset(self):
         self.rst.value(0)
         time.sleep_ms(50)
@@ -57,61 +194,46 @@ class ILI9341:
         self._write_cmd(0x01)  # SWRESET
         time.sleep_ms(50)
 
-        self._write_cmd(0xCF)
-        self._write_data(b'\x00\xC1\x30')
+        self._cmd_data(0xCF, b'\x00\xC1\x30')
 
-        self._write_cmd(0xED)
-        self._write_data(b'\x64\x03\x12\x81')
+        self._cmd_data(0xED, b'\x64\x03\x12\x81')
 
-        self._write_cmd(0xE8)
-        self._write_data(b'\x85\x00\x78')
+        self._cmd_data(0xE8, b'\x85\x00\x78')
 
-        self._write_cmd(0xCB)
-        self._write_data(b'\x39\x2C\x00\x34\x02')
+        self._cmd_data(0xCB, b'\x39\x2C\x00\x34\x02')
 
-        self._write_cmd(0xF7)
-        self._write_data(b'\x20')
+        self._cmd_data(0xF7, b'\x20')
 
-        self._write_cmd(0xEA)
-        self._write_data(b'\x00\x00')
+        self._cmd_data(0xEA, b'\x00\x00')
 
         # Power control
-        self._write_cmd(0xC0)
-        self._write_data(b'\x23')
+        self._cmd_data(0xC0, b'\x23')
 
-        self._write_cmd(0xC1)
-        self._write_data(b'\x10')
+        self._cmd_data(0xC1, b'\x10')
 
         # VCOM
-        self._write_cmd(0xC5)
-        self._write_data(b'\x3E\x28')
+        self._cmd_data(0xC5, b'\x3E\x28')
 
         # Memory access control (rotation + BGR)
-        self._write_cmd(0x36)
         # 0x48 = MX, BGR for portrait 240x320
-        self._write_data(b'\x48')
+        self._cmd_data(0x36, b'\x48')
 
         # Pixel format 16-bit
-        self._write_cmd(0x3A)
-        self._write_data(b'\x55')
+        self._cmd_data(0x3A, b'\x55')
 
         # Frame rate
-        self._write_cmd(0xB1)
-        self._write_data(b'\x00\x18')
+        self._cmd_data(0xB1, b'\x00\x18')
 
         # Display function control
-        self._write_cmd(0xB6)
-        self._write_data(b'\x08\x82\x27')
+        self._cmd_data(0xB6, b'\x08\x82\x27')
 
         # Gamma
-        self._write_cmd(0xF2)
-        self._write_data(b'\x00')
-        self._write_cmd(0x26)
-        self._write_data(b'\x01')
+        self._cmd_data(0xF2, b'\x00')
+        self._cmd_data(0x26, b'\x01')
 
         # Positive gamma
-        self._write_cmd(0xE1)
-        self._write_data(
+        self._cmd_data(
+            0xE1,
             b'\x00\x0E\x14\x03\x11\x07\x31\xC1'
             b'\x48\x08\x0F\x0C\x31\x36\x0F'
         )
@@ -122,42 +244,95 @@ class ILI9341:
         self._write_cmd(0x29)  # DISPON
         time.sleep_ms(20)
 
-    def _set_window(self, x0, y0, x1, y1):
+    def _window_cmd(self, x0, y0, x1, y1, ram_cmd):
+        # CASET, PASET and the RAM command as one CS-low transaction; DC only
+        # flips around the command bytes. Returns with CS still low and DC
+        # high, ready for the pixel stream; the caller raises CS when done.
+        if self._dma_active:
+            self.wait_dma()
+        dc = self.dc
+        write = self.spi.write
+        win = self._win_buf
+        self.cs.value(0)
+
         # Column addr set
-        self._write_cmd(0x2A)
-        self._write_data(bytes([
-            (x0 >> 8) & 0xFF, x0 & 0xFF,
-            (x1 >> 8) & 0xFF, x1 & 0xFF,
-        ]))
+        dc.value(0)
+        write(_CASET)
+        dc.value(1)
+        struct.pack_into(">HH", win, 0, x0, x1)
+        write(win)
 
         # Row addr set
-        self._write_cmd(0x2B)
-        self._write_data(bytes([
-            (y0 >> 8) & 0xFF, y0 & 0xFF,
-            (y1 >> 8) & 0xFF, y1 & 0xFF,
-        ]))
+        dc.value(0)
+        write(_PASET)
+        dc.value(1)
+        struct.pack_into(">HH", win, 0, y0, y1)
+        write(win)
+
+        dc.value(0)
+        write(ram_cmd)
+        dc.value(1)
 
-        # Write to RAM
-        self._write_cmd(0x2C)
+    def _set_window(self, x0, y0, x1, y1):
+        # Write to RAM; leaves CS low (see _window_cmd)
+        self._window_cmd(x0, y0, x1, y1, _RAMWR)
 
     # window setup for RAM READ (no 0x2C)
     def _set_window_for_read(self, x0, y0, x1, y1):
-        # Column addr set
-        self._write_cmd(0x2A)
-        self._write_data(bytes([
-            (x0 >> 8) & 0xFF, x0 & 0xFF,
-            (x1 >> 8) & 0xFF, x1 & 0xFF,
-        ]))
-
-        # Row addr set
-        self._write_cmd(0x2B)
-        self._write_data(bytes([
-            (y0 >> 8) & 0xFF, y0 & 0xFF,
-            (y1 >> 8) & 0xFF, y1 & 0xFF,
-        ]))
-
-        # RAMRD command
-        self._write_cmd(0x2E)
+        # RAMRD command; leaves CS low (see _window_cmd)
+        self._window_cmd(x0, y0, x1, y1, _RAMRD)
+
+    def benchmark_spi(self, fallback_baudrate=_SAFE_BAUDRATE,
+                      read_baudrate=_READ_BAUDRATE, pixels=64):
+        # Write a test pattern to the top-left of the screen at the current
+        # clock, read it back via RAMRD at a slow clock and compare. On a
+        # failure the clock drops to fallback_baudrate. self.spi_check tells
+        # the cases apart: "mismatch" means pixels came back wrong (long
+        # wires, clock too high), "no readback" means every byte read was
+        # the same, as with MISO not connected. Returns the baudrate in use
+        # afterwards.
+        pattern = memoryview(self._linebuf)[:pixels * 2]
+        for i in range(pixels):
+            # keep red == blue so the BGR bit can't change the readback
+            v = (i * 5) & 0x1F
+            g = (i * 7 + 13) & 0x3F
+            struct.pack_into(">H", pattern, i * 2, (v << 11) | (g << 5) | v)
+        self.blit_rgb565(0, 0, pixels, 1, pattern)
+        self.wait_dma()
+
+        # RAMRD returns a dummy byte, then 3 bytes (6 bits each) per pixel
+        readback = bytearray(1 + 3 * pixels)
+        self.spi.init(baudrate=read_baudrate)
+        self._set_window_for_read(0, 0, pixels - 1, 0)
+        self.spi.readinto(readback)
+        self.cs.value(1)
+        self.spi.init(baudrate=self.baudrate)
+
+        # don't leave the pattern on screen
+        self.fill_rect(0, 0, pixels, 1, 0x0000)
+
+        result = "ok"
+        data = memoryview(readback)[1:]
+        if min(data) == max(data):
+            # the pattern varies, so one repeated byte means nothing drove MISO
+            result = "no readback"
+        else:
+            for i in range(pixels):
+                c = (pattern[i * 2] << 8) | pattern[i * 2 + 1]
+                r = readback[1 + i * 3] >> 3
+                g = readback[2 + i * 3] >> 2
+                b = readback[3 + i * 3] >> 3
+                if r != c >> 11 or g != (c >> 5) & 0x3F or b != c & 0x1F:
+                    result = "mismatch"
+                    break
+        self.spi_check = result
+
+        if result != "ok" and self.baudrate > fallback_baudrate:
+            print("ILI9341: SPI self-test", result, "at", self.baudrate,
+                  "Hz, using", fallback_baudrate, "Hz")
+            self.baudrate = fallback_baudrate
+            self.spi.init(baudrate=fallback_baudrate)
+        return self.baudrate
 
     # --- Drawing primitives ---
 
@@ -173,41 +348,88 @@ class ILI9341:
             return
         self._set_window(x, y, x1, y1)
 
-        hi = (colour >> 8) & 0xFF
-        lo = colour & 0xFF
-        chunk = bytes([hi, lo]) * 64
+        chunk = self._fill_chunk
+        mv = self._fill_mv
+        if colour != self._fill_colour:
+            # write one pixel, then keep doubling the filled prefix
+            mv[0:2] = self._pixel_bytes(colour)
+            n = 2
+            size = len(chunk)
+            while n < size:
+                mv[n:2 * n] = mv[0:n]
+                n *= 2
+            self._fill_colour = colour
+
+        # CS is held low by _set_window, so write straight to the bus
+        write = self.spi.write
         pixels = w * h
-        self.dc.value(1)
-        self.cs.value(0)
-        while pixels > 0:
-            n = pixels if pixels < 64 else 64
-            self.spi.write(chunk[:n * 2])
-            pixels -= n
+        while pixels >= 512:
+            write(chunk)
+            pixels -= 512
+        if pixels > 0:
+            write(mv[:pixels * 2])
         self.cs.value(1)
 
     def pixel(self, x, y, colour):
         if 0 <= x < self.width and 0 <= y < self.height:
             self._set_window(x, y, x, y)
-            self._write_data(bytes([(colour >> 8) & 0xFF, colour & 0xFF]))
+            self._write_data(self._pixel_bytes(colour))
 
     def blit_rgb565(self, x, y, w, h, buf):
         self._set_window(x, y, x + w - 1, y + h - 1)
-        self._write_data(buf)
+        if self._dma is not None and len(buf) >= _DMA_MIN_BYTES:
+            self._write_data_dma(buf)
+            return
+        self._write_data_nocs(buf)
+        self.cs.value(1)
+
+    def blit_rgb565_region(self, buf, buf_w, x, y, w, h):
+        # push the (x, y, w, h) part of a buf_w-wide RGB565 buffer to the
+        # same place on screen; full-width regions go out as one write
+        self._set_window(x, y, x + w - 1, y + h - 1)
+        mv = memoryview(buf)
+        stride = buf_w * 2
+        start = (y * buf_w + x) * 2
+        if w == buf_w:
+            data = mv[start:start + h * stride]
+            if self._dma is not None and len(data) >= _DMA_MIN_BYTES:
+                self._write_data_dma(data)
+                return
+            self._write_data(data)
+            return
+
+        n = w * 2
+        for _ in range(h):
+            self._write_data_nocs(mv[start:start + n])
+            start += stride
+        self.cs.value(1)
+
+    def begin_pixels(self, x, y, w, h):
+        # open a window and hold CS for a series of write_pixels() calls
+        self._set_window(x, y, x + w - 1, y + h - 1)
+
+    def write_pixels(self, buf):
+        self._write_data_nocs(buf)
+
+    def end_pixels(self):
+        self.cs.value(1)
 
     def text(self, x, y, text, colour=0xFFFF, bg=0x0000):
         if not text:
             return
         w = 8 * len(text)
         h = 8
-        buf = bytearray(w * h * 2)
+        need = w * h * 2
+        if need <= len(self._text_buf):
+            # the scratch may still be feeding a DMA transfer
+            if self._dma_active:
+                self.wait_dma()
+            buf = memoryview(self._text_buf)[:need]
+        else:
+            buf = bytearray(need)
         fb = framebuf.FrameBuffer(buf, w, h, framebuf.RGB565)
 
-        # fill bg
-        hi_bg = (bg >> 8) & 0xFF
-        lo_bg = bg & 0xFF
-        for i in range(0, len(buf), 2):
-            buf[i] = hi_bg
-            buf[i + 1] = lo_bg
-
+        # framebuf stores pixels little-endian; swap so bg lands hi byte first
+        fb.fill(((bg & 0xFF) << 8) | ((bg >> 8) & 0xFF))
         fb.text(text, 0, 0, colour)
         self.blit_rgb565(x, y, w, h, buf)
@@ -19,35 +19,51 @@ class InputState:
 
 
 class Engine:
-    def __init__(self, gfx, target_fps=30, input_provider=None):
+    def __init__(self, gfx, target_fps=30, input_provider=None, idle_fps=10):
         self.gfx = gfx
         self.target_fps = target_fps
         self.frame_time = 1.0 / target_fps
 
+        # frames with nothing to draw are paced at idle_fps instead
+        self.idle_fps = idle_fps
+        self.idle_frame_time = 1.0 / idle_fps
+
+        # input_provider(out) fills the held flags of an existing InputState.
+        # Two states are allocated once and swapped every frame, so the input
+        # path never allocates.
         self.input_provider = input_provider
-        self._current_input = InputState()
-        self._prev_input = InputState()
+        self._in_a = InputState()
+        self._in_b = InputState()
+        self._current_input = self._in_a
+        self._prev_input = self._in_b
         self._running = True
 
         self._last_up_press_time = None
         self._double_tap_threshold_ms = 400  # 0.4s window
 
+        # game input callbacks, looked up once per run() (None if missing)
+        self._cb_up = None
+        self._cb_down = None
+        self._cb_left = None
+        self._cb_right = None
+        self._cb_a = None
+        self._cb_b = None
+
     # ----- input handling -----
     def _update_input(self):
-        if self.input_provider is None:
-            raw = InputState()
-        else:
-            raw = self.input_provider()
-
         prev = self._current_input
-        cur = InputState()
+        # reuse the buffer from two frames ago
+        cur = self._in_b if prev is self._in_a else self._in_a
 
-        cur.up = raw.up
-        cur.down = raw.down
-        cur.left = raw.left
-        cur.right = raw.right
-        cur.a = raw.a
-        cur.b = raw.b
+        if self.input_provider is None:
+            cur.up = False
+            cur.down = False
+            cur.left = False
+            cur.right = False
+            cur.a = False
+            cur.b = False
+        else:
+            self.input_provider(cur)
 
         cur.up_pressed = cur.up and not prev.up
         cur.down_pressed = cur.down and not prev.down
@@ -59,9 +75,10 @@ class Engine:
         self._prev_input = prev
         self._current_input = cur
 
-    def _dispatch_input_events(self, game):
+    def _bind_input_callbacks(self, game):
         """
-        Call optional callbacks on the game when buttons are just pressed.
+        Look up the optional on_*_pressed callbacks once, so the per-frame
+        dispatch doesn't have to probe the game with hasattr().
         Game can define:
             on_up_pressed(self)
             on_down_pressed(self)
@@ -70,20 +87,29 @@ class Engine:
             on_a_pressed(self)
             on_b_pressed(self)
         """
+        self._cb_up = getattr(game, "on_up_pressed", None)
+        self._cb_down = getattr(game, "on_down_pressed", None)
+        self._cb_left = getattr(game, "on_left_pressed", None)
+        self._cb_right = getattr(game, "on_right_pressed", None)
+        self._cb_a = getattr(game, "on_a_pressed", None)
+        self._cb_b = getattr(game, "on_b_pressed", None)
+
+    def _dispatch_input_events(self):
+        """Call the bound callbacks for buttons that were just pressed."""
         s = self._current_input
 
-        if s.up_pressed and hasattr(game, "on_up_pressed"):
-            game.on_up_pressed()
-        if s.down_pressed and hasattr(game, "on_down_pressed"):
-            game.on_down_pressed()
-        if s.left_pressed and hasattr(game, "on_left_pressed"):
-            game.on_left_pressed()
-        if s.right_pressed and hasattr(game, "on_right_pressed"):
-            game.on_right_pressed()
-        if s.a_pressed and hasattr(game, "on_a_pressed"):
-            game.on_a_pressed()
-        if s.b_pressed and hasattr(game, "on_b_pressed"):
-            game.on_b_pressed()
+        if s.up_pressed and self._cb_up:
+            self._cb_up()
+        if s.down_pressed and self._cb_down:
+            self._cb_down()
+        if s.left_pressed and self._cb_left:
+            self._cb_left()
+        if s.right_pressed and self._cb_right:
+            self._cb_right()
+        if s.a_pressed and self._cb_a:
+            self._cb_a()
+        if s.b_pressed and self._cb_b:
+            self._cb_b()
 
     @property
     def input_state(self):
@@ -92,52 +118,85 @@ class Engine:
     # ----- main loop -----
     def run(self, game):
         self._running = True
-        last_time = time.ticks_ms()
+        self._bind_input_callbacks(game)
+
+        # bind everything the loop touches once; module and attribute
+        # lookups are not free in MicroPython
+        ticks_ms = time.ticks_ms
+        ticks_diff = time.ticks_diff
+        sleep_ms = time.sleep_ms
+        update_input = self._update_input
+        dispatch_input_events = self._dispatch_input_events
+        update = game.update
+        draw = game.draw
+        reset = getattr(game, "reset", None)
+        should_redraw = getattr(game, "should_redraw", None)
+        is_idle = getattr(game, "is_idle", None)
+        gfx = self.gfx
+        sync = getattr(gfx, "sync", None)
+        present = gfx.present
+        frame_ms = int(self.frame_time * 1000)
+        idle_frame_ms = int(self.idle_frame_time * 1000)
+
+        last_time = ticks_ms()
         first_frame = True
 
         while self._running:
-            now = time.ticks_ms()
-            dt_ms = time.ticks_diff(now, last_time)
+            now = ticks_ms()
+            dt_ms = ticks_diff(now, last_time)
             last_time = now
             dt = dt_ms / 1000.0
 
             # 1) input
-            self._update_input()
-            self._dispatch_input_events(game)
+            update_input()
+            dispatch_input_events()
+            state = self._current_input
 
             # --- detect double-tap on UP (reset) ---
-            if self._current_input.up_pressed:
-                if self._last_up_press_time is not None:
-                    diff = time.ticks_diff(now, self._last_up_press_time)
-                    if diff <= self._double_tap_threshold_ms:
-                        self._last_up_press_time = None
-                        if hasattr(game, "reset"):
-                            game.reset()
-                        continue
-                    else:
-                        self._last_up_press_time = now
-                else:
-                    self._last_up_press_time = now
+            # The reset frame still runs update (with dt=0) and draw, so the
+            # fresh state shows up immediately instead of a frame later.
+            last_up = self._last_up_press_time
+            is_double = (state.up_pressed and last_up is not None
+                         and ticks_diff(now, last_up) <= self._double_tap_threshold_ms)
+            if is_double:
+                # a third tap starts a new pair rather than resetting again
+                self._last_up_press_time = None
+                if reset is not None:
+                    reset()
+                dt = 0.0
+            elif state.up_pressed:
+                self._last_up_press_time = now
 
             # 2) game logic
-            game.update(dt, self._current_input)
+            update(dt, state)
 
             # 3) draw only if needed
             should_draw = True
-            if hasattr(game, "should_redraw"):
-                should_draw = game.should_redraw() or first_frame
+            if should_redraw is not None:
+                should_draw = should_redraw() or first_frame
 
             if should_draw:
-                game.draw(self.gfx)
-                self.gfx.present()
+                # game.update() above may overlap a DMA transfer from the
+                # last frame; drawing has to wait for it
+                if sync is not None:
+                    sync()
+                draw(gfx)
+                present()
 
             first_frame = False
 
             # 4) frame limiting
-            elapsed_ms = time.ticks_diff(time.ticks_ms(), now)
-            spare = int(self.frame_time * 1000) - elapsed_ms
+            # A game can define is_idle() to say when it is safe to slow
+            # down; otherwise any frame that drew nothing counts as idle.
+            if is_idle is not None:
+                idle = is_idle()
+            else:
+                idle = not should_draw
+
+            elapsed_ms = ticks_diff(ticks_ms(), now)
+            spare = (idle_frame_ms if idle else frame_ms) - elapsed_ms
             if spare > 0:
-                time.sleep_ms(spare)
+                sleep_ms(spare)
 
     def stop(self):
         self._running = False
@@ -10,6 +10,9 @@ class GameBase:
       - draw(self, gfx)
       - reset(self)
       - on_*_pressed callbacks for input events
+
+    Games can also define is_idle(self) -> bool to tell the engine when it
+    may drop to its idle frame rate (default: whenever nothing was redrawn).
     """
 
     def __init__(self, engine):
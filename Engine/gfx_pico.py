@@ -1,5 +1,78 @@
 from Driver.tft_ili9341 import ILI9341
 import framebuf
+import array
+import micropython
+import struct
+from collections import OrderedDict
+
+# Header of run-length encoded sprites (see tools/encode_rle565.py)
+RLE_MAGIC = b"RLE565"
+
+
+# Horizontal half of a nearest-neighbour upscale: each source row of a
+# bw x bh RGB565 buffer is widened `scale` times and written to the first
+# of its `scale` output rows in dst. The remaining rows are filled by
+# _render_text_sprite with plain row copies.
+@micropython.viper
+def _hscale_rgb565(src: ptr16, dst: ptr16, bw: int, bh: int, scale: int):
+    row_step = bw * scale * scale
+    for sy in range(bh):
+        d = sy * row_step
+        s = sy * bw
+        for sx in range(bw):
+            p = src[s + sx]
+            for _ in range(scale):
+                dst[d] = p
+                d += 1
+
+
+# Expand (count, b0, b1) runs from src[0:n] into dst, writing at most
+# dst_len bytes so a bad file can't run past the buffer.
+@micropython.viper
+def _rle565_decode(src: ptr8, n: int, dst: ptr8, dst_len: int):
+    i = 0
+    d = 0
+    while i + 2 < n:
+        count = src[i]
+        b0 = src[i + 1]
+        b1 = src[i + 2]
+        i += 3
+        if d + 2 * count > dst_len:
+            count = (dst_len - d) >> 1
+        for _ in range(count):
+            dst[d] = b0
+            dst[d + 1] = b1
+            d += 2
+
+
+# Expand n palette indices from src into big-endian RGB565 bytes in dst.
+@micropython.viper
+def _expand_indexed(src: ptr8, pal: ptr16, dst: ptr8, n: int):
+    d = 0
+    for i in range(n):
+        c = pal[src[i]]
+        dst[d] = c >> 8
+        dst[d + 1] = c & 0xFF
+        d += 2
+
+
+# Copy `rows` rows of w pixels from src to dst; strides are in pixels too.
+# Callers pass memoryviews already offset to the first pixel of each side.
+@micropython.viper
+def _copy_rows(dst: ptr16, dst_stride: int, src: ptr16, src_stride: int, w: int, rows: int):
+    d = 0
+    s = 0
+    for _ in range(rows):
+        for i in range(w):
+            dst[d + i] = src[s + i]
+        d += dst_stride
+        s += src_stride
+
+
+def _swap16(colour):
+    # framebuf stores RGB565 little-endian, the panel wants the high byte first
+    return ((colour & 0xFF) << 8) | ((colour >> 8) & 0xFF)
+
 
 class PicoGFX:
     """
@@ -8,22 +81,84 @@ class PicoGFX:
     - clear(colour=0x0000)
     - fill_rect(x, y, w, h, colour=0xFFFF)
     - safe_fill_rect(x, y, w, h, colour=0xFFFF)
+    - draw_rect(x, y, w, h, colour=0xFFFF, thickness=1)
     - draw_text(x, y, text, colour=0xFFFF, bg=None, scale=1)
     - get_text_size(text, scale=1) -> (w, h)
+    - get_text_sprite(text, colour=0xFFFF, bg=None, scale=1)
     - load_sprite_rgb565(path, w, h)
     - draw_sprite(sprite, x, y)
     - draw_image_rgb565(x, y, w, h, buf)
+    - blit_buffer(buf, x, y, w, h)
+    - fill_buffer(buf, colour)
+    - blit_into(dst, dst_w, sprite, x, y)
+    - invalidate(x, y, w, h)
     - present()
+    - sync()
+
+    PicoGFX(buffered=True) draws into an in-RAM RGB565 backbuffer instead of
+    the panel (width * height * 2 bytes, 150 KB at 240x320); present() then
+    pushes only the dirty parts of it.
+
+    PicoGFX(mode="indexed") is buffered too, but keeps one palette index per
+    pixel (framebuf.GS8, 75 KB at 240x320) plus a 256-entry RGB565 palette
+    filled on first use of each colour. Fills and text stay cheap; sprites
+    are mapped to the palette pixel by pixel in Python, so it suits UI-heavy
+    screens with few distinct colours.
+
+    PicoGFX(sprite_arena_size=n) reserves one n-byte block that sprite pixel
+    data is carved out of, instead of one heap allocation per sprite.
     """
 
-    def __init__(self):
+    # Above this many separate dirty rects, present() merges them into one box
+    DIRTY_MAX = 16
+
+    # Text sprites kept in the cache; the least recently used is dropped first
+    TEXT_CACHE_MAX = 32
+
+    # Nearest-colour lookups remembered once the palette is full; the cache
+    # is emptied when it grows past this
+    PAL_NEAR_MAX = 64
+
+    def __init__(self, buffered=False, sprite_arena_size=0, mode="rgb565"):
         self.tft = ILI9341()
         self.width = self.tft.width
         self.height = self.tft.height
 
+        # Optional backbuffer. RGB565 is stored in panel byte order so it can be
+        # sent as-is; indexed holds palette indices expanded in present().
+        self.indexed = mode == "indexed"
+        self.buffered = buffered or self.indexed
+        self._fb_buf = None
+        self._fb = None
+        if self.indexed:
+            self._fb_buf = bytearray(self.width * self.height)
+            self._fb = framebuf.FrameBuffer(self._fb_buf, self.width, self.height,
+                                            framebuf.GS8)
+            self._palette = array.array("H", [0] * 256)
+            self._pal_index = {}  # RGB565 colour -> palette index
+            self._pal_near = {}  # colour not in the palette -> nearest index
+            self._line_buf = bytearray(self.width * 2)
+        elif buffered:
+            self._fb_buf = bytearray(self.width * self.height * 2)
+            self._fb = framebuf.FrameBuffer(self._fb_buf, self.width, self.height,
+                                            framebuf.RGB565)
+
         # Cache for text sprites (for repeated labels like "PLAYER", "DEALER", etc.)
-        # key: (text, colour, bg, scale) -> sprite dict
-        self._text_cache = {}
+        # key: (text, colour, bg, scale) -> sprite dict, oldest use first
+        self._text_cache = OrderedDict()
+
+        # Backbuffer regions touched since the last present(), as (x, y, w, h);
+        # stays empty without a backbuffer, since drawing is then immediate
+        self._dirty = []
+
+        # Optional sprite arena: sprites get memoryview slices of one block,
+        # which keeps the heap from fragmenting. Falls back to the heap once full.
+        self._arena = None
+        self._arena_mv = None
+        self._arena_used = 0
+        if sprite_arena_size > 0:
+            self._arena = bytearray(sprite_arena_size)
+            self._arena_mv = memoryview(self._arena)
 
     # -------------------------------------------------------------------------
     # Basic drawing
@@ -31,11 +166,19 @@ class PicoGFX:
 
     def clear(self, colour=0x0000):
         """Fill the entire display with the given colour."""
-        self.tft.clear(colour)
+        if self._fb is not None:
+            self._fb.fill(self._fb_colour(colour))
+            self._dirty.append((0, 0, self.width, self.height))
+        else:
+            self.tft.clear(colour)
 
     def fill_rect(self, x, y, w, h, colour=0xFFFF):
         """Draw a filled rectangle of a given colour (no clipping)."""
-        self.tft.fill_rect(x, y, w, h, colour)
+        if self._fb is not None:
+            self._fb.fill_rect(x, y, w, h, self._fb_colour(colour))
+            self._dirty.append((x, y, w, h))
+        else:
+            self.tft.fill_rect(x, y, w, h, colour)
 
     def safe_fill_rect(self, x, y, w, h, colour=0xFFFF):
         """
@@ -46,6 +189,11 @@ class PicoGFX:
         if w <= 0 or h <= 0:
             return
 
+        # common case: already on-screen, nothing to clamp
+        if x >= 0 and y >= 0 and x + w <= self.width and y + h <= self.height:
+            self.fill_rect(x, y, w, h, colour)
+            return
+
         x0 = max(0, x)
         y0 = max(0, y)
         x1 = min(self.width, x + w)
@@ -59,20 +207,99 @@ class PicoGFX:
 
         self.fill_rect(x0, y0, cw, ch, colour)
 
+    def draw_rect(self, x, y, w, h, colour=0xFFFF, thickness=1):
+        """
+        Draw a rectangle outline `thickness` pixels wide, inside (x, y, w, h),
+        clipped to the screen. Only the edges are written, so nested frames
+        around a filled area cost no overdraw.
+        Recorded as one dirty rect.
+        """
+        if w <= 0 or h <= 0:
+            return
+        t = min(thickness, w, h)
+        side_h = h - 2 * t
+
+        if self._fb is not None:
+            c = self._fb_colour(colour)
+            if t == 1:
+                self._fb.rect(x, y, w, h, c)
+            else:
+                fill = self._fb.fill_rect
+                fill(x, y, w, t, c)
+                fill(x, y + h - t, w, t, c)
+                if side_h > 0:
+                    fill(x, y + t, t, side_h, c)
+                    fill(x + w - t, y + t, t, side_h, c)
+            self._dirty.append((x, y, w, h))
+            return
+
+        if x < 0 or y < 0 or x + w > self.width or y + h > self.height:
+            # partly off-screen: let safe_fill_rect clip each edge
+            self.safe_fill_rect(x, y, w, t, colour)
+            self.safe_fill_rect(x, y + h - t, w, t, colour)
+            self.safe_fill_rect(x, y + t, t, side_h, colour)
+            self.safe_fill_rect(x + w - t, y + t, t, side_h, colour)
+            return
+
+        fill = self.tft.fill_rect
+        fill(x, y, w, t, colour)
+        fill(x, y + h - t, w, t, colour)
+        fill(x, y + t, t, side_h, colour)
+        fill(x + w - t, y + t, t, side_h, colour)
+
     def draw_image_rgb565(self, x, y, w, h, buf):
         """Draw raw RGB565 image buffer at (x, y)."""
-        self.tft.blit_rgb565(x, y, w, h, buf)
+        if self._fb is None:
+            self.tft.blit_rgb565(x, y, w, h, buf)
+            return
+        if self.indexed:
+            self._blit_to_fb_indexed(x, y, w, h, buf)
+        else:
+            self._blit_to_fb(x, y, w, h, buf)
+        self._dirty.append((x, y, w, h))
+
+    def blit_buffer(self, buf, x, y, w, h):
+        """
+        Draw a raw RGB565 buffer (w*h pixels, panel byte order) at (x, y).
+        Same as draw_image_rgb565, for callers that build pixel data
+        themselves (pre-tiled strips, composed rows) rather than loading sprites.
+        """
+        self.draw_image_rgb565(x, y, w, h, buf)
+
+    def invalidate(self, x, y, w, h):
+        """
+        Mark a screen region as changed so the next present() pushes it.
+        Drawing calls already do this; use it for regions changed some other way.
+        Without a backbuffer the panel is always current, so nothing is recorded.
+        """
+        if self._fb is not None:
+            self._dirty.append((x, y, w, h))
 
     def present(self):
         """
-        For compatibility with a potential buffered backend.
-        Drawing is currently immediate so this does nothing.
+        End of frame: merge the regions drawn since the last call into a few
+        dirty rects and flush them.
+        With buffered=True this is what actually updates the panel; otherwise
+        drawing is immediate and flushing does nothing.
         Call at the end of each frame anyway so games don't care if you later add double buffering.
         """
-        pass
+        if not self._dirty:
+            return
+        rects = self._merge_dirty()
+        self._dirty = []
+        self._flush_rects(rects)
+
+    def sync(self):
+        """
+        Wait for any display transfer still running in the background.
+        Large blits and present() may return while DMA is still sending; the
+        engine calls this before draw() so the next frame does not touch
+        buffers (like the backbuffer) that are still being read.
+        """
+        self.tft.wait_dma()
 
     def clear_caches(self):
-        self._text_cache = {}
+        self._text_cache = OrderedDict()
         import gc
         gc.collect()
 
@@ -123,13 +350,33 @@ class PicoGFX:
         if scale == 1 and bg is None:
             # IMPORTANT: correct argument order for your driver:
             # text(self, x, y, text, colour=0xFFFF, bg=0x0000)
-            self.tft.text(x, y, text, colour)
+            if self._fb is not None:
+                # match the driver, which always paints a black background
+                self._fb.fill_rect(x, y, w, h, self._fb_colour(0))
+                if self.indexed:
+                    # the RGB565 paths hand framebuf the colour unswapped, so
+                    # this is the colour they end up showing
+                    colour = self._colour_index(_swap16(colour))
+                self._fb.text(text, x, y, colour)
+                self._dirty.append((x, y, w, h))
+            else:
+                self.tft.text(x, y, text, colour)
             return
 
         # Otherwise: render into a sprite and draw that sprite
         sprite = self._get_text_sprite(text, colour, bg, scale)
         self.draw_sprite(sprite, x, y)
 
+    def get_text_sprite(self, text, colour=0xFFFF, bg=None, scale=1):
+        """
+        Return the sprite draw_text() draws for this text (from the text
+        cache), e.g. to compose it into a buffer with blit_into().
+        The sprite is shared with the cache, so don't modify its data.
+        """
+        if scale < 1:
+            scale = 1
+        return self._get_text_sprite(text, colour, bg, scale)
+
     # -------------------------------------------------------------------------
     # Sprite loading / drawing
     # -------------------------------------------------------------------------
@@ -137,17 +384,262 @@ class PicoGFX:
     def load_sprite_rgb565(self, path, w, h):
         """
         Load a RGB565 .bin sprite from SD or flash and return a sprite dict:
-        { "w": w, "h": h, "data": <bytes>, "path": <str or None> }
+        { "w": w, "h": h, "data": <buffer>, "path": <str or None> }
+        Files starting with RLE_MAGIC are run-length decoded on load.
+        "data" is a memoryview into the sprite arena if one was configured.
+        Pixels are read straight into "data" and never copied again, so a
+        sprite costs exactly its w * h * 2 bytes; to keep many sprites in one
+        block, use the arena rather than a combined sheet file.
         Use draw_sprite() to draw it.
         """
         with open(path, "rb") as f:
-            data = f.read()
+            if f.read(len(RLE_MAGIC)) == RLE_MAGIC:
+                size = struct.unpack("<I", f.read(4))[0]
+                packed = f.read()
+                data = self._alloc_sprite_data(size)
+                _rle565_decode(packed, len(packed), data, size)
+            else:
+                f.seek(0)
+                data = self._alloc_sprite_data(w * h * 2)
+                f.readinto(data)
         return {"w": w, "h": h, "data": data, "path": path}
 
+    def reset_sprite_arena(self):
+        """
+        Rewind the sprite arena so its space can be reused.
+        Every sprite loaded into the arena before this call becomes invalid.
+        """
+        self._arena_used = 0
+
     def draw_sprite(self, sprite, x, y):
         """Draw a previously loaded sprite (or text sprite)."""
         self.draw_image_rgb565(x, y, sprite["w"], sprite["h"], sprite["data"])
 
+    # -------------------------------------------------------------------------
+    # Composing off-screen buffers
+    # -------------------------------------------------------------------------
+
+    def fill_buffer(self, buf, colour):
+        """
+        Fill an RGB565 buffer (panel byte order) with one colour.
+        Together with blit_into() this builds a region in RAM that is then
+        sent with a single blit_buffer() call.
+        Waits for any DMA transfer first, since buf may still be streaming out.
+        """
+        self.sync()
+        n = len(buf)
+        if n < 2:
+            return
+        mv = memoryview(buf)
+        mv[0] = (colour >> 8) & 0xFF
+        mv[1] = colour & 0xFF
+        # double the filled prefix until the buffer is full
+        done = 2
+        while done < n:
+            k = min(done, n - done)
+            mv[done:done + k] = mv[0:k]
+            done += k
+
+    def blit_into(self, dst, dst_w, sprite, x, y):
+        """
+        Copy a sprite into an RGB565 buffer dst_w pixels wide, with its
+        top-left corner at (x, y) in that buffer. Clipped to the buffer.
+        Nothing is drawn on screen. Like fill_buffer(), waits for DMA first.
+        """
+        self.sync()
+        w = sprite["w"]
+        h = sprite["h"]
+        dst_h = len(dst) // (dst_w * 2)
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(dst_w, x + w)
+        y1 = min(dst_h, y + h)
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        s = ((y0 - y) * w + (x0 - x)) * 2
+        d = (y0 * dst_w + x0) * 2
+        _copy_rows(memoryview(dst)[d:], dst_w, memoryview(sprite["data"])[s:], w,
+                   x1 - x0, y1 - y0)
+
+    # -------------------------------------------------------------------------
+    # Internal helpers for sprite storage
+    # -------------------------------------------------------------------------
+
+    def _alloc_sprite_data(self, size):
+        """Internal: n bytes for sprite pixels, from the arena when it has room."""
+        if self._arena is not None and self._arena_used + size <= len(self._arena):
+            start = self._arena_used
+            self._arena_used = start + size
+            return self._arena_mv[start:start + size]
+        return bytearray(size)
+
+    # -------------------------------------------------------------------------
+    # Internal helpers for dirty rects
+    # -------------------------------------------------------------------------
+
+    def _merge_dirty(self):
+        """
+        Internal: clip the dirty list to the screen and union overlapping or
+        touching rects. Returns a list of (x, y, w, h).
+        If more than DIRTY_MAX rects remain they are merged into one bounding box.
+        """
+        merged = []
+        for x, y, w, h in self._dirty:
+            x0 = max(0, x)
+            y0 = max(0, y)
+            x1 = min(self.width, x + w)
+            y1 = min(self.height, y + h)
+            if x1 <= x0 or y1 <= y0:
+                continue
+
+            i = 0
+            while i < len(merged):
+                mx0, my0, mx1, my1 = merged[i]
+                if x0 <= mx1 and mx0 <= x1 and y0 <= my1 and my0 <= y1:
+                    # grow this rect and re-check it against the others
+                    x0 = min(x0, mx0)
+                    y0 = min(y0, my0)
+                    x1 = max(x1, mx1)
+                    y1 = max(y1, my1)
+                    merged.pop(i)
+                    i = 0
+                else:
+                    i += 1
+            merged.append((x0, y0, x1, y1))
+
+        if len(merged) > self.DIRTY_MAX:
+            x0 = min(r[0] for r in merged)
+            y0 = min(r[1] for r in merged)
+            x1 = max(r[2] for r in merged)
+            y1 = max(r[3] for r in merged)
+            merged = [(x0, y0, x1, y1)]
+
+        return [(x0, y0, x1 - x0, y1 - y0) for x0, y0, x1, y1 in merged]
+
+    def _flush_rects(self, rects):
+        """
+        Internal: push the given dirty rects from the backbuffer to the display.
+        Nothing to do while drawing goes straight to the panel.
+        """
+        if self._fb_buf is None:
+            return
+        if self.indexed:
+            self._flush_rects_indexed(rects)
+            return
+        for x, y, w, h in rects:
+            self.tft.blit_rgb565_region(self._fb_buf, self.width, x, y, w, h)
+
+    def _flush_rects_indexed(self, rects):
+        """Internal: expand each dirty rect through the palette a line at a time."""
+        src = memoryview(self._fb_buf)
+        line = memoryview(self._line_buf)
+        pal = self._palette
+        tft = self.tft
+        for x, y, w, h in rects:
+            tft.begin_pixels(x, y, w, h)
+            off = y * self.width + x
+            out = line[:w * 2]
+            for _ in range(h):
+                _expand_indexed(src[off:off + w], pal, out, w)
+                tft.write_pixels(out)
+                off += self.width
+            tft.end_pixels()
+
+    # -------------------------------------------------------------------------
+    # Internal helpers for the backbuffer
+    # -------------------------------------------------------------------------
+
+    def _fb_colour(self, colour):
+        """Internal: RGB565 colour -> value to hand the backbuffer's framebuf."""
+        if self.indexed:
+            return self._colour_index(colour)
+        return _swap16(colour)
+
+    def _colour_index(self, colour):
+        """
+        Internal: palette index for an RGB565 colour, adding it on first use.
+        Once all 256 entries are taken, new colours map to the nearest one.
+        """
+        idx = self._pal_index.get(colour)
+        if idx is not None:
+            return idx
+
+        n = len(self._pal_index)
+        if n < 256:
+            self._palette[n] = colour
+            self._pal_index[colour] = n
+            return n
+
+        idx = self._pal_near.get(colour)
+        if idx is None:
+            idx = self._nearest_index(colour)
+            if len(self._pal_near) >= self.PAL_NEAR_MAX:
+                self._pal_near = {}
+            self._pal_near[colour] = idx
+        return idx
+
+    def _nearest_index(self, colour):
+        """Internal: index of the closest palette entry (squared RGB distance)."""
+        r = colour >> 11
+        g = (colour >> 5) & 0x3F
+        b = colour & 0x1F
+        best = 0
+        best_d = 1 << 30
+        for i, c in enumerate(self._palette):
+            dr = (c >> 11) - r
+            dg = ((c >> 5) & 0x3F) - g
+            db = (c & 0x1F) - b
+            d = dr * dr + dg * dg + db * db
+            if d < best_d:
+                best = i
+                best_d = d
+        return best
+
+    def _blit_to_fb_indexed(self, x, y, w, h, buf):
+        """Internal: map an RGB565 buffer onto the palette and copy it in, clipped."""
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + w)
+        y1 = min(self.height, y + h)
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        dst = self._fb_buf
+        pal_get = self._pal_index.get
+        for row in range(y0, y1):
+            s = ((row - y) * w + (x0 - x)) * 2
+            d = row * self.width + x0
+            for _ in range(x1 - x0):
+                c = (buf[s] << 8) | buf[s + 1]
+                idx = pal_get(c)
+                if idx is None:
+                    idx = self._colour_index(c)
+                dst[d] = idx
+                s += 2
+                d += 1
+
+    def _blit_to_fb(self, x, y, w, h, buf):
+        """Internal: copy an RGB565 buffer into the backbuffer, clipped to the screen."""
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + w)
+        y1 = min(self.height, y + h)
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        src = memoryview(buf)
+        dst = memoryview(self._fb_buf)
+        n = (x1 - x0) * 2
+        s = ((y0 - y) * w + (x0 - x)) * 2
+        d = (y0 * self.width + x0) * 2
+        src_stride = w * 2
+        dst_stride = self.width * 2
+        for _ in range(y1 - y0):
+            dst[d:d + n] = src[s:s + n]
+            s += src_stride
+            d += dst_stride
+
     # -------------------------------------------------------------------------
     # Internal helpers for text sprites
     # -------------------------------------------------------------------------
@@ -158,11 +650,15 @@ class PicoGFX:
         This is used by draw_text() when scale > 1 or bg is specified.
         """
         key = (text, colour, bg, scale)
-        spr = self._text_cache.get(key)
-        if spr is not None:
-            return spr
-        spr = self._render_text_sprite(text, colour, bg, scale)
-        self._text_cache[key] = spr
+        cache = self._text_cache
+        spr = cache.pop(key, None)
+        if spr is None:
+            spr = self._render_text_sprite(text, colour, bg, scale)
+        # (re)insert as most recently used
+        cache[key] = spr
+        while len(cache) > self.TEXT_CACHE_MAX:
+            # dropping the entry releases its pixel buffer to the GC
+            del cache[next(iter(cache))]
         return spr
 
     def _render_text_sprite(self, text, colour, bg, scale):
@@ -208,14 +704,17 @@ class PicoGFX:
         out_h = base_h * scale
         out_buf = bytearray(out_w * out_h * 2)
 
-        for sy in range(out_h):
-            src_y = sy // scale
-            for sx in range(out_w):
-                src_x = sx // scale
-                src_index = 2 * (src_y * base_w + src_x)
-                dst_index = 2 * (sy * out_w + sx)
-                out_buf[dst_index] = small_buf[src_index]
-                out_buf[dst_index + 1] = small_buf[src_index + 1]
+        # widen each source row in viper, then duplicate it downwards with
+        # memoryview slice copies (a memcpy each)
+        _hscale_rgb565(small_buf, out_buf, base_w, base_h, scale)
+        out_mv = memoryview(out_buf)
+        row_bytes = out_w * 2
+        for sy in range(base_h):
+            src = sy * scale * row_bytes
+            row = out_mv[src:src + row_bytes]
+            for k in range(1, scale):
+                dst = src + k * row_bytes
+                out_mv[dst:dst + row_bytes] = row
 
         return {
             "w": out_w,
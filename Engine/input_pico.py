@@ -1,5 +1,4 @@
 from machine import Pin
-from Engine.engine_core import InputState
 
 PIN_UP = 21
 PIN_DOWN = 20
@@ -11,18 +10,24 @@ btn_down = Pin(PIN_DOWN, Pin.IN, Pin.PULL_UP)
 btn_left = Pin(PIN_LEFT, Pin.IN, Pin.PULL_UP)
 btn_right = Pin(PIN_RIGHT, Pin.IN, Pin.PULL_UP)
 
+# bound once so each frame skips the attribute lookups
+_up_val = btn_up.value
+_down_val = btn_down.value
+_left_val = btn_left.value
+_right_val = btn_right.value
 
-def read_input_state():
+
+def read_input_state(out):
     """
-    Read physical buttons and return an InputState object.
+    Read physical buttons into an existing InputState.
     Buttons wired to GND with PULL_UP, so pressed = 0
-    :return: InputState
+    :param out: InputState to fill (held flags only)
     """
-    s = InputState()
-    s.up = (btn_up.value() == 0)
-    s.down = (btn_down.value() == 0)
-    s.left = (btn_left.value() == 0)
-    s.right = (btn_right.value() == 0)
+    out.up = not _up_val()
+    out.down = not _down_val()
+    out.left = not _left_val()
+    out.right = not _right_val()
 
     # no a/b yet, is kept as false
-    return s
\ No newline at end of file
+    out.a = False
+    out.b = False
@@ -1,12 +1,56 @@
-import gc
+import micropython
 import random
+from collections import OrderedDict
 from Engine.game_base import GameBase
 
+_SUITS = ("Clubs", "Diamonds", "Hearts", "Spades")
+_RANKS = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "ACE")
 
-def mp_shuffle(lst):
-    for i in range(len(lst) - 1, 0, -1):
-        j = random.getrandbits(16) % (i + 1)
-        lst[i], lst[j] = lst[j], lst[i]
+# Blackjack value of each rank (aces count 11 until the hand busts)
+_RANK_VALUE = {
+    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
+    "10": 10, "J": 10, "Q": 10, "K": 10, "ACE": 11,
+}
+
+# The deck never changes, so its ids and per-card tables are built once
+_FULL_DECK = tuple(f"{s}_{r}" for s in _SUITS for r in _RANKS)
+_CARD_VALUE = {f"{s}_{r}": _RANK_VALUE[r] for s in _SUITS for r in _RANKS}
+_CARD_IS_ACE = {cid: cid.endswith("_ACE") for cid in _FULL_DECK}
+_BACK_FILES = tuple(f"Back_{i}.bin" for i in range(1, 6))
+
+
+# Random bits needed for an index below n, for every n up to a full deck
+_INDEX_BITS = tuple(len(bin(n - 1)) - 2 if n > 1 else 0
+                    for n in range(len(_FULL_DECK) + 1))
+
+
+def _rand_below(n):
+    """
+    Unbiased index in [0, n), n <= 52, by mask rejection: draw just enough
+    bits to cover n - 1 and redraw while the value is out of range. Under
+    half of the draws are rejected, and there is no multiply or modulo.
+    """
+    bits = _INDEX_BITS[n]
+    if bits == 0:
+        return 0
+    r = random.getrandbits(bits)
+    while r >= n:
+        r = random.getrandbits(bits)
+    return r
+
+
+# Add one card to a hand kept as bytearray(2): [total, aces still counted
+# as 11]. Aces drop to 1 while the hand is bust. Returns the new total.
+@micropython.viper
+def _hand_add(hand: ptr8, val: int, ace: int) -> int:
+    total = hand[0] + val
+    aces = hand[1] + ace
+    while total > 21 and aces > 0:
+        total -= 10
+        aces -= 1
+    hand[0] = total
+    hand[1] = aces
+    return total
 
 
 class BlackjackGame(GameBase):
@@ -14,7 +58,7 @@ class BlackjackGame(GameBase):
     Blackjack UI + basic game logic.
 
     - Uses /bin_files/<Suit>_<Rank>.bin for card faces.
-    - Uses /bin_files/Back_1.bin for the back of the dealer card.
+    - Uses /bin_files/Back_1.bin .. Back_5.bin for the back of the dealer card.
     - Left button  = HIT
     - Right button = STAND
     """
@@ -25,7 +69,16 @@ class BlackjackGame(GameBase):
 
     # Paths
     CARD_PATH_ROOT = "/bin_files/"
-    CARD_BACK_FILE = "Back_{num}.bin"
+
+    # Card faces kept loaded (3.8 KB each); the least recently used is
+    # dropped first. More than a round normally has on the table.
+    FACE_CACHE_MAX = 16
+
+    # Hand totals run from 2 to 31, so at most two 8x8 characters
+    MIN_TOTAL = 2
+    MAX_TOTAL = 31
+    POINTS_W = 16
+    POINTS_H = 8
 
     def __init__(self, engine):
         super().__init__(engine)
@@ -82,8 +135,32 @@ class BlackjackGame(GameBase):
         self.stand_btn_x = self.table_x + 20 + self.button_w
         self.btn_y = self.button_bar_y + (self.bottom_bar_h - self.button_h) // 2
 
-        # sprites cache: id -> sprite dict
-        self.card_sprites = {}
+        # button labels, centred in their buttons
+        hit_w, hit_h = self.gfx.get_text_size("HIT", scale=1)
+        stand_w, stand_h = self.gfx.get_text_size("STAND", scale=1)
+        self.hit_tx = self.hit_btn_x + (self.button_w - hit_w) // 2
+        self.hit_ty = self.btn_y + (self.button_h - hit_h) // 2
+        self.stand_tx = self.stand_btn_x + (self.button_w - stand_w) // 2
+        self.stand_ty = self.btn_y + (self.button_h - stand_h) // 2
+
+        # "Dealer"/"Player" labels inside the velvet area, totals beside them
+        self.label_x = self.card_area_x + 6
+        self.dealer_label_y = self.card_area_y + 4
+        self.player_label_y = self.player_row_y - 23
+        self.points_x = self.label_x + 60
+        self.dealer_points_y = self.dealer_label_y + 10
+        self.player_points_y = self.player_label_y + 10
+        # pre-rendered total tiles, allocated on first use (see _number_tile)
+        self._num_tiles = None
+        self._num_ready = None
+
+        # one card row is composed here and sent with a single blit
+        self._row_h = self.CARD_H + 4
+        self._row_buf = bytearray(self.card_area_w * self._row_h * 2)
+
+        # face sprites cache: id -> sprite dict, oldest use first
+        self.card_sprites = OrderedDict()
+        self._preload_sprites()
 
         # draw static table once
         self._static_drawn = False
@@ -98,30 +175,25 @@ class BlackjackGame(GameBase):
         self.player_final = 0
 
         # back sprite random change
-        self.dealer_back_sprite = self._load_card_sprite(self.CARD_BACK_FILE.format(num=random.randint(1, 5)))
+        backs = self._back_sprites
+        self.dealer_back_sprite = backs[_rand_below(len(backs))]
 
-        # full new deck
+        # full new deck, shuffled lazily one card per draw
         self.deck = self._build_deck()
-        mp_shuffle(self.deck)
+        self._deck_ptr = 0
 
         # deal initial cards
-        self.player_cards = [self._draw_card_id()]
-        self.dealer_cards = [self._draw_card_id()]
+        self._start_hands()
 
-        self.status_text = "Blackjack demo"
+        self._set_status("Blackjack demo")
         self.request_redraw()
 
     def reset(self):
         """
         Called by engine when user double-taps UP.
-        Starts a completely new round.
-        Clears caches.
+        Starts a completely new round. The face cache is bounded by
+        FACE_CACHE_MAX, so there is nothing to flush or collect here.
         """
-        self.card_sprites = {}
-
-        self.gfx.clear_caches()
-        gc.collect()
-
         self._reset_round()
 
     # ---------------------------------------------------------------------
@@ -129,19 +201,34 @@ class BlackjackGame(GameBase):
     # ---------------------------------------------------------------------
 
     def _build_deck(self):
-        suits = ["Clubs", "Diamonds", "Hearts", "Spades"]
-        ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "ACE"]
-        deck = []
-        for s in suits:
-            for r in ranks:
-                deck.append(f"{s}_{r}")
-        return deck
+        return list(_FULL_DECK)
 
     def _draw_card_id(self):
-        if not self.deck:
+        """
+        Deal the next card with a lazy Fisher-Yates step: swap a random card
+        from the undealt part deck[_deck_ptr:] into slot _deck_ptr and
+        return it. A round only shuffles as many cards as it deals.
+        """
+        n = len(self.deck)
+        if self._deck_ptr >= n:
             self.deck = self._build_deck()
-            mp_shuffle(self.deck)
-        return self.deck.pop()
+            self._deck_ptr = 0
+            n = len(self.deck)
+
+        deck = self.deck
+        k = self._deck_ptr
+        j = k + _rand_below(n - k)
+        deck[k], deck[j] = deck[j], deck[k]
+        self._deck_ptr = k + 1
+        return deck[k]
+
+    def _preload_sprites(self):
+        """
+        Load the five card backs (19 KB) once, so a new round never reads
+        one from flash. All 52 faces would need about 200 KB, more than the
+        whole RP2040 heap, so faces are loaded on first use instead.
+        """
+        self._back_sprites = [self._load_card_sprite(f) for f in _BACK_FILES]
 
     def _load_card_sprite(self, file_name):
         """Load a card sprite by its filename (e.g. 'Hearts_10.bin')."""
@@ -152,40 +239,46 @@ class BlackjackGame(GameBase):
         """
         card_id example: 'Hearts_10' -> uses 'Hearts_10.bin'
         """
-        if card_id not in self.card_sprites:
-            file_name = card_id + ".bin"
-            self.card_sprites[card_id] = self._load_card_sprite(file_name)
-        return self.card_sprites[card_id]
-
-    def _hand_value(self, card_ids):
+        cache = self.card_sprites
+        sprite = cache.pop(card_id, None)
+        if sprite is None:
+            # make room first, so the old face can be collected for this one
+            while len(cache) >= self.FACE_CACHE_MAX:
+                del cache[next(iter(cache))]
+            sprite = self._load_card_sprite(card_id + ".bin")
+        # (re)insert as most recently used
+        cache[card_id] = sprite
+        return sprite
+
+    def _append_to_hand(self, cards, hand):
         """
-        Basic Blackjack hand value calculation.
-        card_ids: list of 'Suit_RANK' strings.
+        Deal a card into `cards` and return the hand's new total.
+        `hand` is the bytearray(2) state updated in O(1) by _hand_add.
         """
-        total = 0
-        aces = 0
-        for cid in card_ids:
-            rank = cid.split("_", 1)[1]
-            if rank == "ACE":
-                val = 11
-                aces += 1
-            elif rank in ("J", "Q", "K"):
-                val = 10
-            else:
-                val = int(rank)
-            total += val
-
-        while total > 21 and aces > 0:
-            total -= 10
-            aces -= 1
-
-        return total
+        cid = self._draw_card_id()
+        cards.append(cid)
+        return _hand_add(hand, _CARD_VALUE[cid], _CARD_IS_ACE[cid])
+
+    def _set_status(self, text):
+        self.status_text = text
+        self._dirty_status = True
+
+    def _start_hands(self):
+        """Deal one card each into fresh hands."""
+        self.player_cards = []
+        self.dealer_cards = []
+        self.player_hand = bytearray(2)
+        self.dealer_hand = bytearray(2)
+        self.player_total = self._append_to_hand(self.player_cards, self.player_hand)
+        self.dealer_total = self._append_to_hand(self.dealer_cards, self.dealer_hand)
+        self._dirty_points = True
+        self._dirty_player_cards = True
+        self._dirty_dealer_cards = True
 
     def _deal_initial_cards(self):
-        self.player_cards = [self._draw_card_id()]
-        self.dealer_cards = [self._draw_card_id()]
+        self._start_hands()
         self.state = "player_turn"
-        self.status_text = "Blackjack demo"
+        self._set_status("Blackjack demo")
         self.request_redraw()
 
     # ---------------------------------------------------------------------
@@ -205,21 +298,23 @@ class BlackjackGame(GameBase):
         self._player_stand()
 
     def _player_hit(self):
-        self.player_cards.append(self._draw_card_id())
-        player_val = self._hand_value(self.player_cards)
+        self.player_total = self._append_to_hand(self.player_cards, self.player_hand)
+        self._dirty_points = True
+        self._dirty_player_cards = True
+        player_val = self.player_total
 
         if player_val > 21:
-            self.status_text = "Bust! You lose."
+            self._set_status("Bust! You lose.")
             self.state = "round_over"
         else:
-            self.status_text = "You hit!"
+            self._set_status("You hit!")
 
         self.request_redraw()
 
     def _player_stand(self):
         # Player is done; dealer will auto-play with delay.
-        self.player_final = self._hand_value(self.player_cards)
-        self.status_text = "Dealer's turn..."
+        self.player_final = self.player_total
+        self._set_status("Dealer's turn...")
         self.state = "dealer_turn"
         self.dealer_timer = 0.0
         self.request_redraw()
@@ -237,32 +332,34 @@ class BlackjackGame(GameBase):
                 self._dealer_step()
 
     def _dealer_step(self):
-        dealer_val = self._hand_value(self.dealer_cards)
+        dealer_val = self.dealer_total
 
         # If dealer already beat player, end immediately
         if self.player_final < dealer_val <= 21:
-            self.status_text = "Dealer wins!"
+            self._set_status("Dealer wins!")
             self.state = "round_over"
             self.request_redraw()
             return
         elif dealer_val == self.player_final and dealer_val == 21:
-            self.status_text = "Draw!"
+            self._set_status("Draw!")
             self.state = "round_over"
             self.request_redraw()
             return
 
         # Otherwise take a card
-        self.dealer_cards.append(self._draw_card_id())
-        dealer_val = self._hand_value(self.dealer_cards)
+        self.dealer_total = self._append_to_hand(self.dealer_cards, self.dealer_hand)
+        self._dirty_points = True
+        self._dirty_dealer_cards = True
+        dealer_val = self.dealer_total
 
         if dealer_val > 21:
-            self.status_text = "Dealer busts! You win!"
+            self._set_status("Dealer busts! You win!")
             self.state = "round_over"
         elif dealer_val > self.player_final:
-            self.status_text = "Dealer wins!"
+            self._set_status("Dealer wins!")
             self.state = "round_over"
         else:
-            self.status_text = "Dealer hits..."
+            self._set_status("Dealer hits...")
 
         self.request_redraw()
 
@@ -272,6 +369,8 @@ class BlackjackGame(GameBase):
 
         - Static table (border, felt, checker, labels, buttons) is drawn once.
         - For each change we redraw small regions: points, cards, status text.
+          Each region has a _dirty_* flag set by whatever changed it, so a
+          redraw only repaints the regions that actually changed.
         """
         if not self._static_drawn:
             self._draw_static_table(gfx)
@@ -296,25 +395,21 @@ class BlackjackGame(GameBase):
         gfx.fill_rect(self.table_x - 2, self.table_y - 2,
                       self.table_w + 4, self.table_h + 4, self.TABLE_BORDER)
 
-        # whole table inner (green)
-        gfx.fill_rect(self.table_x, self.table_y,
-                      self.table_w, self.table_h, self.TABLE_GREEN)
-
-        # checker pattern on the green felt (outside velvet)
+        # whole table inner: green checker felt (velvet is painted over it)
         self._draw_checker_pattern(gfx)
 
         # --- CENTRAL VELVET TABLE ---
         # outer dark brown ring
-        gfx.fill_rect(
+        gfx.draw_rect(
             self.card_area_x - 4, self.card_area_y - 4,
             self.card_area_w + 8, self.card_area_h + 8,
-            self.TABLE_BORDER,
+            self.TABLE_BORDER, thickness=2,
         )
         # darker red border
-        gfx.fill_rect(
+        gfx.draw_rect(
             self.card_area_x - 2, self.card_area_y - 2,
             self.card_area_w + 4, self.card_area_h + 4,
-            self.CARD_AREA_DARK_RED,
+            self.CARD_AREA_DARK_RED, thickness=2,
         )
         # inner red felt
         gfx.fill_rect(
@@ -324,130 +419,181 @@ class BlackjackGame(GameBase):
         )
 
         # --- static labels INSIDE velvet area ---
-        label_x = self.card_area_x + 6
-        dealer_label_y = self.card_area_y + 4
-        player_label_y = self.player_row_y - 23
+        label_x = self.label_x
+        dealer_label_y = self.dealer_label_y
+        player_label_y = self.player_label_y
 
-        gfx.draw_text(label_x, dealer_label_y, "Dealer", self.TEXT_WHITE,
-                      bg=self.CARD_AREA_RED, scale=1)
-        gfx.draw_text(label_x, dealer_label_y + 10, "Points:", self.TEXT_WHITE,
-                      bg=self.CARD_AREA_RED, scale=1)
+        draw_text = gfx.draw_text
+        white = self.TEXT_WHITE
+        red = self.CARD_AREA_RED
 
-        gfx.draw_text(label_x, player_label_y, "Player", self.TEXT_WHITE,
-                      bg=self.CARD_AREA_RED, scale=1)
-        gfx.draw_text(label_x, player_label_y + 10, "Points:", self.TEXT_WHITE,
-                      bg=self.CARD_AREA_RED, scale=1)
+        draw_text(label_x, dealer_label_y, "Dealer", white, bg=red, scale=1)
+        draw_text(label_x, self.dealer_points_y, "Points:", white, bg=red, scale=1)
+
+        draw_text(label_x, player_label_y, "Player", white, bg=red, scale=1)
+        draw_text(label_x, self.player_points_y, "Points:", white, bg=red, scale=1)
 
         # draw buttons (background + labels), static shape on the green bar
         self._draw_buttons_static(gfx)
 
+    def _build_checker_strip(self, block):
+        """
+        One RGB565 band of the felt, table_w wide and two blocks tall
+        (both phases of the checker), ready to blit down the table.
+        """
+        row_bytes = self.table_w * 2
+        strip = bytearray(row_bytes * block * 2)
+        mv = memoryview(strip)
+
+        dark_hi = (self.TABLE_GREEN_DARK >> 8) & 0xFF
+        dark_lo = self.TABLE_GREEN_DARK & 0xFF
+        green_hi = (self.TABLE_GREEN >> 8) & 0xFF
+        green_lo = self.TABLE_GREEN & 0xFF
+
+        # first row of each phase pixel by pixel; dark squares start at x = 0
+        # in the top phase and at x = block in the bottom one
+        bottom = row_bytes * block
+        for x in range(self.table_w):
+            i = x * 2
+            if (x // block) % 2 == 0:
+                strip[i], strip[i + 1] = dark_hi, dark_lo
+                strip[bottom + i], strip[bottom + i + 1] = green_hi, green_lo
+            else:
+                strip[i], strip[i + 1] = green_hi, green_lo
+                strip[bottom + i], strip[bottom + i + 1] = dark_hi, dark_lo
+
+        # then copy each first row down the rest of its phase
+        for start in (0, bottom):
+            for r in range(1, block):
+                off = start + r * row_bytes
+                mv[off:off + row_bytes] = mv[start:start + row_bytes]
+        return strip
+
     def _draw_checker_pattern(self, gfx):
         block = 8
-        for y in range(self.table_y, self.table_y + self.table_h, block):
-            for x in range(self.table_x, self.table_x + self.table_w, block):
-                if ((x - self.table_x) // block + (y - self.table_y) // block) % 2 == 0:
-                    gfx.fill_rect(x, y, block, block, self.TABLE_GREEN_DARK)
+        band_h = block * 2
+        strip = self._build_checker_strip(block)
+        mv = memoryview(strip)
+        row_bytes = self.table_w * 2
+
+        blit_buffer = gfx.blit_buffer
+        x = self.table_x
+        w = self.table_w
+        bottom = self.table_y + self.table_h
+        for y in range(self.table_y, bottom, band_h):
+            h = min(band_h, bottom - y)
+            blit_buffer(mv[:h * row_bytes], x, y, w, h)
 
     # ---------------------------------------------------------------------
     # Dynamic drawing: numbers, cards, status, button highlight
     # ---------------------------------------------------------------------
 
-    def _draw_points_only(self, gfx):
-        # erase numeric parts and redraw them, on red velvet
-        label_x = self.card_area_x + 6
-        dealer_label_y = self.card_area_y + 4
-        player_label_y = self.player_row_y - 23
-
-        # dealer points area
-        gfx.safe_fill_rect(label_x + 60, dealer_label_y + 10, 40, 10, self.CARD_AREA_RED)
-        dealer_points = self._hand_value(self.dealer_cards)
-        gfx.draw_text(label_x + 60, dealer_label_y + 10,
-                      str(dealer_points), self.TEXT_YELLOW,
-                      bg=self.CARD_AREA_RED, scale=1)
-
-        # player points area
-        gfx.safe_fill_rect(label_x + 60, player_label_y + 10, 40, 10, self.CARD_AREA_RED)
-        player_points = self._hand_value(self.player_cards)
-        gfx.draw_text(label_x + 60, player_label_y + 10,
-                      str(player_points), self.TEXT_YELLOW,
-                      bg=self.CARD_AREA_RED, scale=1)
-
-    def _compute_card_positions(self, num_cards, row_y):
-        if num_cards <= 0:
-            return []
+    def _number_tile(self, gfx, n):
+        """
+        RGB565 tile (POINTS_W x POINTS_H) of the total n in yellow on red
+        felt. All 30 tiles share one 7.5 KB buffer; each is rendered the
+        first time its total is shown and reused after that.
+        """
+        size = self.POINTS_W * self.POINTS_H * 2
+        if self._num_tiles is None:
+            count = self.MAX_TOTAL - self.MIN_TOTAL + 1
+            self._num_tiles = bytearray(size * count)
+            self._num_ready = bytearray(count)
+
+        i = n - self.MIN_TOTAL
+        tile = memoryview(self._num_tiles)[i * size:(i + 1) * size]
+        if not self._num_ready[i]:
+            red = self.CARD_AREA_RED
+            gfx.fill_buffer(tile, red)
+            text = gfx.get_text_sprite(str(n), self.TEXT_YELLOW, bg=red)
+            gfx.blit_into(tile, self.POINTS_W, text, 0, 0)
+            self._num_ready[i] = 1
+        return tile
 
-        area_x = self.card_area_x
+    def _draw_points_only(self, gfx):
+        # totals only change when a card is dealt
+        if not self._dirty_points:
+            return
+        self._dirty_points = False
+
+        # each total is one blit of its cached tile over the old one; two
+        # digits wide, so it always covers the previous total
+        blit_buffer = gfx.blit_buffer
+        points_x = self.points_x
+        w = self.POINTS_W
+        h = self.POINTS_H
+        blit_buffer(self._number_tile(gfx, self.dealer_total),
+                    points_x, self.dealer_points_y, w, h)
+        blit_buffer(self._number_tile(gfx, self.player_total),
+                    points_x, self.player_points_y, w, h)
+
+    def _card_xs(self, num_cards):
+        """Yield the screen x of each of num_cards cards centred in a row."""
         area_w = self.card_area_w
+        card_w = self.CARD_W
 
-        spacing = self.CARD_W + 6
-        total_width = spacing * (num_cards - 1) + self.CARD_W
+        spacing = card_w + 6
+        total_width = spacing * (num_cards - 1) + card_w
 
         if total_width > area_w:
-            spacing = max(2, (area_w - self.CARD_W) // max(1, (num_cards - 1)))
-            total_width = spacing * (num_cards - 1) + self.CARD_W
+            spacing = max(2, (area_w - card_w) // max(1, (num_cards - 1)))
+            total_width = spacing * (num_cards - 1) + card_w
 
-        start_x = area_x + (area_w - total_width) // 2
-        xs = [start_x + i * spacing for i in range(num_cards)]
-        ys = [row_y] * num_cards
-        return list(zip(xs, ys))
+        x = self.card_area_x + (area_w - total_width) // 2
+        for _ in range(num_cards):
+            yield x
+            x += spacing
 
     def _draw_cards_only(self, gfx):
-        # Clear dealer + player card rows to red felt, then redraw cards.
-
-        row_height = self.CARD_H + 4
-
-        # dealer row (inside card area)
-        gfx.safe_fill_rect(
-            self.card_area_x,
-            self.dealer_row_y,
-            self.card_area_w,
-            row_height,
-            self.CARD_AREA_RED,
-        )
-
-        # player row (inside card area)
-        gfx.safe_fill_rect(
-            self.card_area_x,
-            self.player_row_y,
-            self.card_area_w,
-            row_height,
-            self.CARD_AREA_RED,
-        )
+        # Card positions are centred, so adding a card moves the whole row:
+        # repaint each row that changed as a unit, skip the one that didn't.
+        if self._dirty_dealer_cards:
+            self._draw_dealer_row(gfx)
+            self._dirty_dealer_cards = False
+        if self._dirty_player_cards:
+            self._draw_player_row(gfx)
+            self._dirty_player_cards = False
+
+    def _begin_row(self, gfx):
+        # fill_buffer waits if the previous row is still going out over DMA
+        gfx.fill_buffer(self._row_buf, self.CARD_AREA_RED)
+
+    def _end_row(self, gfx, row_y):
+        gfx.blit_buffer(self._row_buf, self.card_area_x, row_y,
+                        self.card_area_w, self._row_h)
+
+    def _draw_dealer_row(self, gfx):
+        # Compose the dealer row (red felt + cards) in RAM, then send it.
+        self._begin_row(gfx)
+        blit_into = gfx.blit_into
+        get_sprite = self._get_card_sprite_for_id
+        row = self._row_buf
+        row_w = self.card_area_w
+        x0 = self.card_area_x
 
         # Dealer: back + one or more front cards
-        dealer_positions = self._compute_card_positions(
-            max(2, len(self.dealer_cards) + 1),
-            self.dealer_row_y,
-        )
-
-        if len(dealer_positions) >= 2:
-            (back_x, back_y), first_front = dealer_positions[0], dealer_positions[1]
-        else:
-            back_x = self.table_x + (self.table_w - self.CARD_W) // 2
-            back_y = self.dealer_row_y
-            first_front = (back_x + self.CARD_W + 4, back_y)
-
-        # back card
-        gfx.draw_sprite(self.dealer_back_sprite, back_x, back_y)
-
-        # front dealer cards
-        for idx, cid in enumerate(self.dealer_cards):
-            if idx == 0:
-                fx, fy = first_front
-            else:
-                # subsequent cards follow positions after the first front
-                pos_index = min(idx + 1, len(dealer_positions) - 1)
-                fx, fy = dealer_positions[pos_index]
-            sprite = self._get_card_sprite_for_id(cid)
-            gfx.draw_sprite(sprite, fx, fy)
+        xs = self._card_xs(max(2, len(self.dealer_cards) + 1))
+        blit_into(row, row_w, self.dealer_back_sprite, next(xs) - x0, 0)
+        for cid in self.dealer_cards:
+            blit_into(row, row_w, get_sprite(cid), next(xs) - x0, 0)
+
+        self._end_row(gfx, self.dealer_row_y)
+
+    def _draw_player_row(self, gfx):
+        # Compose the player row (red felt + cards) in RAM, then send it.
+        self._begin_row(gfx)
+        blit_into = gfx.blit_into
+        get_sprite = self._get_card_sprite_for_id
+        row = self._row_buf
+        row_w = self.card_area_w
+        x0 = self.card_area_x
 
         # Player cards row
-        player_positions = self._compute_card_positions(
-            len(self.player_cards), self.player_row_y
-        )
-        for card_id, (cx, cy) in zip(self.player_cards, player_positions):
-            sprite = self._get_card_sprite_for_id(card_id)
-            gfx.draw_sprite(sprite, cx, cy)
+        xs = self._card_xs(len(self.player_cards))
+        for card_id in self.player_cards:
+            blit_into(row, row_w, get_sprite(card_id), next(xs) - x0, 0)
+
+        self._end_row(gfx, self.player_row_y)
 
     def _draw_buttons_static(self, gfx):
         # Buttons are rectangles with text "HIT" and "STAND"
@@ -456,42 +602,26 @@ class BlackjackGame(GameBase):
 
         # Hit button shape
         gfx.fill_rect(self.hit_btn_x, self.btn_y, self.button_w, self.button_h, btn_col)
-        gfx.safe_fill_rect(self.hit_btn_x, self.btn_y, self.button_w, 1, outline)
-        gfx.safe_fill_rect(self.hit_btn_x, self.btn_y + self.button_h - 1,
-                           self.button_w, 1, outline)
-        gfx.safe_fill_rect(self.hit_btn_x, self.btn_y, 1, self.button_h, outline)
-        gfx.safe_fill_rect(self.hit_btn_x + self.button_w - 1, self.btn_y,
-                           1, self.button_h, outline)
+        gfx.draw_rect(self.hit_btn_x, self.btn_y, self.button_w, self.button_h, outline)
 
         # Stand button shape
         gfx.fill_rect(self.stand_btn_x, self.btn_y, self.button_w, self.button_h, btn_col)
-        gfx.safe_fill_rect(self.stand_btn_x, self.btn_y, self.button_w, 1, outline)
-        gfx.safe_fill_rect(self.stand_btn_x, self.btn_y + self.button_h - 1,
-                           self.button_w, 1, outline)
-        gfx.safe_fill_rect(self.stand_btn_x, self.btn_y, 1, self.button_h, outline)
-        gfx.safe_fill_rect(self.stand_btn_x + self.button_w - 1, self.btn_y,
-                           1, self.button_h, outline)
+        gfx.draw_rect(self.stand_btn_x, self.btn_y, self.button_w, self.button_h, outline)
 
         # Static button labels
-        hit_label = "HIT"
-        stand_label = "STAND"
-        hit_w, hit_h = self.gfx.get_text_size(hit_label, scale=1)
-        stand_w, stand_h = self.gfx.get_text_size(stand_label, scale=1)
-
-        hit_tx = self.hit_btn_x + (self.button_w - hit_w) // 2
-        hit_ty = self.btn_y + (self.button_h - hit_h) // 2
-        gfx.draw_text(hit_tx, hit_ty, hit_label, self.TEXT_WHITE,
+        gfx.draw_text(self.hit_tx, self.hit_ty, "HIT", self.TEXT_WHITE,
                       bg=btn_col, scale=1)
-
-        stand_tx = self.stand_btn_x + (self.button_w - stand_w) // 2
-        stand_ty = self.btn_y + (self.button_h - stand_h) // 2
-        gfx.draw_text(stand_tx, stand_ty, stand_label, self.TEXT_WHITE,
+        gfx.draw_text(self.stand_tx, self.stand_ty, "STAND", self.TEXT_WHITE,
                       bg=btn_col, scale=1)
 
     def _draw_buttons_and_status(self, gfx):
         """
         Only redraw status text (buttons are static).
         """
+        if not self._dirty_status:
+            return
+        self._dirty_status = False
+
         msg = self.status_text
         msg_w, msg_h = self.gfx.get_text_size(msg, scale=1)
         msg_x = self.card_area_x + (self.card_area_w - msg_w) // 2
@@ -0,0 +1,85 @@
+"""
+Encode raw RGB565 .bin sprites into the RLE565 format that
+PicoGFX.load_sprite_rgb565() decodes on load.
+
+Format:
+    b"RLE565"               6-byte magic
+    <uint32 little-endian>  decoded size in bytes
+    (count, b0, b1) ...     runs of `count` (1..255) identical pixels, where
+                            b0 b1 are the two pixel bytes as stored in the
+                            raw file (high byte first)
+
+Runs only pay off for sprites with flat areas; the script reports the size
+of each file and leaves it raw if encoding would make it bigger.
+
+Usage (on the PC, not the Pico):
+    python tools/encode_rle565.py in.bin [in2.bin ...] [-o OUT_DIR]
+"""
+import os
+import struct
+import sys
+
+MAGIC = b"RLE565"
+
+
+def encode(raw):
+    """Return the RLE565 encoding of a raw RGB565 byte string."""
+    if len(raw) % 2:
+        raise ValueError("RGB565 data must have an even number of bytes")
+
+    out = bytearray(MAGIC)
+    out += struct.pack("<I", len(raw))
+
+    i = 0
+    n = len(raw)
+    while i < n:
+        b0 = raw[i]
+        b1 = raw[i + 1]
+        count = 1
+        j = i + 2
+        while count < 255 and j < n and raw[j] == b0 and raw[j + 1] == b1:
+            count += 1
+            j += 2
+        out += bytes((count, b0, b1))
+        i = j
+    return bytes(out)
+
+
+def main(argv):
+    out_dir = None
+    paths = []
+    args = iter(argv)
+    for a in args:
+        if a == "-o":
+            out_dir = next(args)
+        else:
+            paths.append(a)
+
+    if not paths:
+        print(__doc__)
+        return 1
+
+    for path in paths:
+        with open(path, "rb") as f:
+            raw = f.read()
+        if raw.startswith(MAGIC):
+            print(f"{path}: already RLE565, skipped")
+            continue
+
+        packed = encode(raw)
+        target = path if out_dir is None else os.path.join(out_dir, os.path.basename(path))
+        if len(packed) >= len(raw):
+            print(f"{path}: {len(raw)} -> {len(packed)} bytes, left raw")
+            packed = raw
+        else:
+            print(f"{path}: {len(raw)} -> {len(packed)} bytes")
+
+        if out_dir is not None:
+            os.makedirs(out_dir, exist_ok=True)
+        with open(target, "wb") as f:
+            f.write(packed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))